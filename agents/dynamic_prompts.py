@@ -15,6 +15,7 @@ class Context:
     topic : str = "the user"
     user_level: str = "A1"
     current_topic :str = "topic_0"
+    agent_story: str = "happy_harry"
 
 # Module-level variable to capture last generated prompt (for logging)
 _last_system_prompt = None
@@ -23,6 +24,10 @@ def get_last_system_prompt() -> str:
     """Return the last generated system prompt (for transcript logging)."""
     return _last_system_prompt
 
+def get_agent_name(ctx: Context) -> str:
+    """Return the tutor's name for the selected agent story (e.g. 'Harry')."""
+    return prompts["agent_name"][ctx.agent_story]
+
 @dynamic_prompt
 def personalized_prompt(request: ModelRequest) -> str:
     global _last_system_prompt
@@ -30,7 +35,7 @@ def personalized_prompt(request: ModelRequest) -> str:
     conversation_goal = prompts["conversation_goal"][ctx.user_level][ctx.current_topic]
 
     #These ones maybe to come from the user selection in the UI? specially the last []
-    agent_story = prompts["agent_story"]["happy_harry"]
+    agent_story = prompts["agent_story"][ctx.agent_story]
     agent_personality = prompts["agent_personality"]["friendly"]
 
     prompt = conversation_prompt.format(
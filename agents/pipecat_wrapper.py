@@ -8,6 +8,9 @@ from .dynamic_prompts import Context, get_last_system_prompt
 # Session logger reference (set by factory.py)
 _session_logger = None
 
+# Thread for InMemorySaver (one voice session = one thread)
+_run_config = {"configurable": {"thread_id": "voice-session"}}
+
 def set_session_logger(logger):
     """Set the session logger for transcript logging."""
     global _session_logger
@@ -19,13 +22,10 @@ async def _astream(input_dict, config=None):
     text = input_dict.get("input", "")
     messages = {"messages": [{"role": "user", "content": text}]}
 
-    # Add thread_id for InMemorySaver
-    run_config = {"configurable": {"thread_id": "voice-session"}}
-
     # Use stream_mode="messages" for token-by-token streaming
     async for token, metadata in _raw_agent.astream(
         messages,
-        config=run_config,
+        config=_run_config,
         context=Context(),
         stream_mode="messages"
     ):
@@ -40,6 +40,18 @@ async def _astream(input_dict, config=None):
             _session_logger.write_system_prompt(prompt)
 
 
+async def append_exchange(user_text: str, agent_text: str):
+    """Add a turn to the agent history without calling the LLM (repeat fast path)."""
+    await _raw_agent.aupdate_state(
+        _run_config,
+        {"messages": [
+            {"role": "user", "content": user_text},
+            {"role": "assistant", "content": agent_text},
+        ]},
+        as_node="model",
+    )
+
+
 # Export wrapper that Pipecat can use
 class conversation_agent:
     model = CONVERSATIONAL_MODEL
@@ -18,6 +18,7 @@ class SessionLogger:
     - MACRO: Total latency (user stopped → audio started)
     - MICRO: STT, LLM, TTS breakdown
     - User and agent text
+    - Repeat fast path hits and latency saved vs normal turns
     """
 
     def __init__(self, log_dir: str = "logs/conversations"):
@@ -53,6 +54,13 @@ class SessionLogger:
         # Turn content trackers
         self._user_text = None
         self._agent_text = None
+        self._fast_path = False
+
+        # Session totals (fast path report)
+        self._turn_count = 0
+        self._fast_path_count = 0
+        self._llm_latencies = []  # Macro latency of normal (LLM) turns
+        self._fast_path_latencies = []
 
     def write_header(self, config: dict = None):
         """Write session header with config. Call AFTER services are created."""
@@ -138,6 +146,14 @@ class SessionLogger:
         else:
             self._agent_text += " " + text
 
+    def on_fast_path(self, user_text: str, agent_text: str):
+        """Called when a repeat request is answered from cached audio (no LLM/TTS)."""
+        self._transcription_ts = datetime.now()
+        self._tts_started_ts = self._transcription_ts
+        self._user_text = user_text
+        self._agent_text = agent_text
+        self._fast_path = True
+
     def on_bot_started_speaking(self):
         """Called when audio playback starts."""
         self._bot_started_ts = datetime.now()
@@ -158,12 +174,22 @@ class SessionLogger:
         llm = (self._tts_started_ts - self._transcription_ts).total_seconds() if self._tts_started_ts and self._transcription_ts else 0
         tts = (self._bot_started_ts - self._tts_started_ts).total_seconds() if self._tts_started_ts else 0
 
+        self._turn_count += 1
+        if self._fast_path:
+            self._fast_path_count += 1
+            self._fast_path_latencies.append(macro)
+        else:
+            self._llm_latencies.append(macro)
+
         # Format output
         time_str = self._bot_started_ts.strftime("%H:%M:%S")
         self._write(f"[{time_str}] TURN LATENCY: {macro:.1f}s (user stopped -> audio started)")
         self._write(f"           ├─ STT:    {stt:.1f}s")
-        self._write(f"           ├─ LLM:    {llm:.1f}s")
-        self._write(f"           └─ TTS:    {tts:.1f}s")
+        if self._fast_path:
+            self._write(f"           └─ REPLAY: {tts:.1f}s (fast path, no LLM/TTS call)")
+        else:
+            self._write(f"           ├─ LLM:    {llm:.1f}s")
+            self._write(f"           └─ TTS:    {tts:.1f}s")
 
         # Truncate long text
         user_display = (self._user_text[:80] + "...") if self._user_text and len(self._user_text) > 80 else self._user_text
@@ -191,6 +217,27 @@ class SessionLogger:
         self._bot_started_ts = None
         self._user_text = None
         self._agent_text = None
+        self._fast_path = False
+
+    def _write_fast_path_summary(self):
+        """Write repeat fast path hit rate and estimated latency saved."""
+        if not self._turn_count:
+            return
+        hit_rate = self._fast_path_count / self._turn_count * 100
+        self._write(f"FAST PATH: {self._fast_path_count}/{self._turn_count} turns ({hit_rate:.0f}%)")
+
+        if not self._fast_path_latencies:
+            return
+        avg_fast = sum(self._fast_path_latencies) / len(self._fast_path_latencies)
+        if not self._llm_latencies:
+            self._write(f"           avg latency: {avg_fast:.1f}s fast path (no LLM turns to compare)")
+            return
+
+        # Estimate: each fast path turn would have cost an average LLM turn
+        avg_llm = sum(self._llm_latencies) / len(self._llm_latencies)
+        saved = (avg_llm - avg_fast) * self._fast_path_count
+        self._write(f"           avg latency: {avg_fast:.1f}s fast path vs {avg_llm:.1f}s LLM")
+        self._write(f"           est. saved vs avg LLM turn: ~{saved:.1f}s")
 
     def close(self):
         """Close session and write footer."""
@@ -198,6 +245,7 @@ class SessionLogger:
         duration = session_end - self._session_start
         duration_str = self._format_duration(int(duration.total_seconds()))
 
+        self._write_fast_path_summary()
         self._file.write("\n" + "=" * 70 + "\n")
         self._file.write(f"SESSION END: {session_end.strftime('%Y-%m-%d %H:%M:%S')} | Duration: {duration_str}\n")
         self._file.write("=" * 70 + "\n")
@@ -1,3 +1,3 @@
 from .factory import pipeline
 from .converters import TranscriptionToContextConverter
-
+from .repeat import LastResponseAudioCache, is_repeat_request
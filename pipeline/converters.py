@@ -12,6 +12,8 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.processors.aggregators.llm_context import LLMContext
 
+from .repeat import LastResponseAudioCache, is_repeat_request, replay_frames
+
 
 class TranscriptionToContextConverter(FrameProcessor):
     """Converts TranscriptionFrame to LLMContextFrame with VAD gating.
@@ -19,11 +21,24 @@ class TranscriptionToContextConverter(FrameProcessor):
     Buffers transcriptions while user is speaking.
     Only sends to LLM after user stops speaking.
     Does NOT track history (agent uses InMemorySaver).
+
+    With a repeat_cache, "sorry?" / "again please" turns skip the LLM and
+    replay the last question's audio instead. The "on_repeat_request"
+    handler runs before the replay, so history is updated before the
+    learner's next turn reaches the agent.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        repeat_cache: LastResponseAudioCache = None,
+        repeat_names: tuple = (),
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._buffer = ""
+        self._repeat_cache = repeat_cache
+        self._repeat_names = repeat_names  # Tutor name(s), e.g. "Sorry Harry, what?"
+        self._register_event_handler("on_repeat_request", sync=True)
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
@@ -39,8 +54,16 @@ class TranscriptionToContextConverter(FrameProcessor):
 
         elif isinstance(frame, UserStoppedSpeakingFrame):
             # User stopped - send accumulated text to LLM
-            if self._buffer.strip():
-                context = LLMContext([{"role": "user", "content": self._buffer.strip()}])
+            text = self._buffer.strip()
+            if text and self._is_repeat(text):
+                # Fast path - replay cached audio, no LLM or TTS call
+                segments = self._repeat_cache.question_segments()
+                replayed_text = " ".join(seg_text for seg_text, _ in segments)
+                await self._call_event_handler("on_repeat_request", text, replayed_text)
+                for replay in replay_frames(segments):
+                    await self.push_frame(replay)
+            elif text:
+                context = LLMContext([{"role": "user", "content": text}])
                 await self.push_frame(LLMContextFrame(context=context))
             self._buffer = ""
             await self.push_frame(frame, direction)
@@ -48,3 +71,9 @@ class TranscriptionToContextConverter(FrameProcessor):
         else:
             # Pass all other frames through
             await self.push_frame(frame, direction)
+
+    def _is_repeat(self, text: str) -> bool:
+        """Check if this turn can be answered by replaying the last response."""
+        if self._repeat_cache is None or not self._repeat_cache.has_response:
+            return False
+        return is_repeat_request(text, self._repeat_names)
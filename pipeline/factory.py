@@ -11,10 +11,12 @@ from pipecat.processors.frameworks.langchain import LangchainProcessor
 from pipecat.processors.audio.audio_buffer_processor import AudioBufferProcessor
 
 from .converters import TranscriptionToContextConverter
+from .repeat import LastResponseAudioCache
 
 # Your LangChain agent
 from agents import conversation_agent
-from agents.pipecat_wrapper import set_session_logger
+from agents.pipecat_wrapper import set_session_logger, append_exchange
+from agents.dynamic_prompts import Context, get_agent_name
 
 # Session logging
 from logs import setup_session_logger
@@ -34,13 +36,25 @@ async def pipeline():
         # Text-to-Speech (MiniMax with custom params)
         tts = tts_minimax(session)
 
+        # Last response audio, replayed when the user asks "sorry?" / "again please"
+        repeat_cache = LastResponseAudioCache()
+
         # Simple frame converter (agent handles memory via InMemorySaver)
-        converter = TranscriptionToContextConverter()
+        converter = TranscriptionToContextConverter(
+            repeat_cache=repeat_cache,
+            repeat_names=(get_agent_name(Context()),),  # "Sorry Harry, what?"
+        )
 
         # Session logger - extracts config dynamically from services
         session_logger = setup_session_logger(stt, tts, conversation_agent.model)
         set_session_logger(session_logger)  # Enable transcript logging
 
+        # Repeat fast path - log the turn and keep agent history in sync
+        @converter.event_handler("on_repeat_request")
+        async def on_repeat_request(converter, user_text, agent_text):
+            session_logger.on_fast_path(user_text, agent_text)
+            await append_exchange(user_text, agent_text)
+
         # Audio buffer processor for recording
         audiobuffer = AudioBufferProcessor(num_channels=1)
 
@@ -73,6 +87,7 @@ async def pipeline():
             converter,
             llm,
             tts,
+            repeat_cache,  # After TTS - caches last response audio
             transport.output(),
             audiobuffer,  # After output - captures both streams
         ])
@@ -0,0 +1,183 @@
+"""
+Fast path for "repeat that" / clarification turns.
+
+A1 learners often ask the tutor to repeat itself ("sorry?", "again please").
+Instead of a full LLM + TTS round trip, we detect these locally and replay
+the audio of the last question, which we already synthesized.
+"""
+
+import re
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMFullResponseStartFrame,
+    LLMFullResponseEndFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSAudioRawFrame,
+    TTSTextFrame,
+    InterruptionFrame,
+)
+from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
+
+
+# Longer utterances are real answers, even if they contain "what" or "sorry"
+MAX_REPEAT_WORDS = 8
+
+# Politeness / hesitation words stripped from both ends before matching.
+# The tutor's name ("Sorry Harry, what?") is passed in separately via names=.
+# "so" is left out on purpose: "so what" is not a repeat request.
+_FILLERS = ("i'm sorry", "excuse me", "pardon me", "sorry", "pardon", "please",
+            "um", "uh", "erm", "oh", "ok", "okay")
+
+# Utterances that are only these count as a repeat request on their own
+_POLITE_ONLY = {"i'm sorry", "excuse me", "pardon me", "sorry", "pardon"}
+
+# Only a repeat request as the whole utterance - "uh huh" means yes
+_WHOLE_ONLY = {"huh"}
+
+_REPEAT_PHRASES = {
+    "what", "again", "come again", "once more", "one more time",
+    "repeat", "repeat that", "repeat it", "repeat the question",
+    "can you repeat", "can you repeat that", "could you repeat", "could you repeat that",
+    "say again", "say that again", "can you say that again", "could you say that again",
+    "what did you say", "what was that", "what was the question",
+    "i don't understand", "i didn't understand", "i don't get it",
+    "i didn't get that", "i didn't catch that",
+}
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, drop punctuation (keep apostrophes), collapse whitespace."""
+    text = text.lower().replace("’", "'")
+    text = re.sub(r"[^\w\s']", " ", text)
+    return " ".join(text.split())
+
+
+def _strip_fillers(text: str, fillers: tuple) -> str:
+    """Remove filler words from the start and end until nothing changes."""
+    changed = True
+    while changed and text:
+        changed = False
+        for filler in fillers:
+            if text == filler:
+                return ""
+            if text.startswith(filler + " "):
+                text = text[len(filler) + 1:]
+                changed = True
+            elif text.endswith(" " + filler):
+                text = text[:-len(filler) - 1]
+                changed = True
+    return text
+
+
+def _core(text: str, names: tuple) -> tuple:
+    """Return (normalized, core) where core has fillers and names stripped."""
+    normalized = _normalize(text)
+    if not normalized or len(normalized.split()) > MAX_REPEAT_WORDS:
+        return "", None
+    fillers = _FILLERS + tuple(_normalize(name) for name in names)
+    return normalized, _strip_fillers(normalized, fillers)
+
+
+def is_repeat_request(text: str, names: tuple = ()) -> bool:
+    """Return True if the utterance only asks the tutor to repeat itself.
+
+    names: tutor name(s) to ignore, e.g. ("Harry",) for "Sorry Harry, what?"
+    "Slower please" is not a match: cached audio can't be slowed down, so
+    those requests go to the LLM like any other turn.
+    """
+    normalized, core = _core(text, names)
+    if core is None:
+        return False
+    if normalized in _WHOLE_ONLY:
+        return True
+    if not core:
+        # "Sorry?" / "Pardon?" alone, but not "okay please"
+        return any(word in normalized for word in _POLITE_ONLY)
+    return core in _REPEAT_PHRASES
+
+
+class LastResponseAudioCache(FrameProcessor):
+    """Remembers the audio and text of the last complete bot response.
+
+    Place right after the TTS service. Audio is only recorded between
+    LLMFullResponseStartFrame and LLMFullResponseEndFrame, so replayed
+    audio (which has no LLM frames around it) never overwrites the cache.
+    An interrupted response clears the cache, as the tutor is no longer
+    asking the previous question.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._recording = False
+        self._segments = []  # One [text, audio frames] pair per TTS sentence
+        self._last_segments = []
+
+    @property
+    def has_response(self) -> bool:
+        """True once a full response has been cached."""
+        return bool(self._last_segments)
+
+    def question_segments(self) -> list:
+        """(text, frames) pairs from the last question onwards.
+
+        Skips any comment before the question, as the prompt asks the tutor
+        to repeat its question. Falls back to the full response.
+        """
+        for i in range(len(self._last_segments) - 1, -1, -1):
+            if self._last_segments[i][0].rstrip().endswith("?"):
+                return self._last_segments[i:]
+        return self._last_segments
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMFullResponseStartFrame):
+            # New response - start recording from scratch
+            self._recording = True
+            self._segments = []
+
+        elif isinstance(frame, InterruptionFrame):
+            # User cut the response short - never cache a partial response,
+            # and don't fall back to the question from the turn before
+            if self._recording:
+                self._last_segments = []
+            self._recording = False
+            self._segments = []
+
+        elif isinstance(frame, LLMFullResponseEndFrame) and self._recording:
+            # Response finished - keep it as the one to replay
+            self._recording = False
+            segments = [(text.strip(), frames) for text, frames in self._segments if frames]
+            if segments:
+                self._last_segments = segments
+
+        elif self._recording:
+            if isinstance(frame, TTSStartedFrame):
+                self._segments.append(["", []])
+            elif isinstance(frame, TTSAudioRawFrame):
+                if not self._segments:
+                    self._segments.append(["", []])
+                self._segments[-1][1].append(frame)
+            elif isinstance(frame, TTSTextFrame):
+                # Text follows the audio of its sentence
+                if not self._segments:
+                    self._segments.append(["", []])
+                self._segments[-1][0] += frame.text + " "
+
+        await self.push_frame(frame, direction)
+
+
+def replay_frames(segments: list) -> list:
+    """Build the frames to replay cached (text, frames) segments as spoken."""
+    frames = [TTSStartedFrame()]
+    for _, segment in segments:
+        for frame in segment:
+            frames.append(TTSAudioRawFrame(
+                audio=frame.audio,
+                sample_rate=frame.sample_rate,
+                num_channels=frame.num_channels,
+            ))
+    frames.append(TTSStoppedFrame())
+    return frames
@@ -0,0 +1,44 @@
+"""
+Tests for the "repeat that" fast path classifier (pipeline/repeat.py).
+"""
+
+import pytest
+
+pytest.importorskip("pipecat")
+
+from pipeline.repeat import is_repeat_request
+
+
+@pytest.mark.parametrize("text", [
+    "Sorry?",
+    "Pardon?",
+    "What?",
+    "Huh?",
+    "again please",
+    "Can you repeat that, please?",
+    "Um, sorry, what did you say?",
+    "I don't understand.",
+    "I’m sorry?",
+])
+def test_repeat_requests(text):
+    assert is_repeat_request(text)
+
+
+@pytest.mark.parametrize("text", [
+    "Uh huh",
+    "uh-huh",
+    "So what?",
+    "ok please",
+    "slower please",
+    "What do you like to eat?",
+    "Sorry, I was at the park yesterday",
+    "",
+])
+def test_not_repeat_requests(text):
+    assert not is_repeat_request(text)
+
+
+def test_tutor_name_is_stripped_only_when_given():
+    assert is_repeat_request("Sorry Harry, what?", names=("Harry",))
+    assert not is_repeat_request("Sorry Harry, what?")
+    assert not is_repeat_request("Harry", names=("Harry",))